@@ -12,7 +12,7 @@ Results classes for extracting molecular torsions.
 from collections import defaultdict
 from .results import Results
 from ...molecular.torsion import TorsionInfo, Torsion
-from ...utilities import calculate_dihedral
+from ...utilities import calculate_dihedrals
 
 
 class TorsionResults(Results):
@@ -32,32 +32,13 @@ class TorsionResults(Results):
         return self._mol
 
     def get_torsion_angles(self):
-        for torsion in self._torsions:
-            print('a', torsion)
-            yield (
-                torsion, calculate_dihedral(
-                    pt1=tuple(
-                        self._mol.get_atomic_positions(
-                            torsion.get_atom_ids()[0]
-                        )
-                    )[0],
-                    pt2=tuple(
-                        self._mol.get_atomic_positions(
-                            torsion.get_atom_ids()[1]
-                        )
-                    )[0],
-                    pt3=tuple(
-                        self._mol.get_atomic_positions(
-                            torsion.get_atom_ids()[2]
-                        )
-                    )[0],
-                    pt4=tuple(
-                        self._mol.get_atomic_positions(
-                            torsion.get_atom_ids()[3]
-                        )
-                    )[0],
-                )
-            )
+        torsions = tuple(self._torsions)
+        angles = calculate_dihedrals(
+            position_matrix=self._mol.get_position_matrix(),
+            atom_ids=(torsion.get_atom_ids() for torsion in torsions),
+        )
+        for torsion, angle in zip(torsions, angles.tolist()):
+            yield torsion, angle
 
 
 class ConstructedMoleculeTorsionResults(TorsionResults):
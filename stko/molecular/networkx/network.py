@@ -6,10 +6,17 @@ Network
 
 Class for defining a :mod:`networkx` graph from a molecule.
 
+The connectivity is held in :mod:`numpy` arrays and connected
+components are found with :mod:`scipy.sparse.csgraph`, the
+:mod:`networkx` graph is built on demand.
+
 """
 
 import logging
+import numpy as np
 import networkx as nx
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +27,8 @@ class PositionedAtom:
 
     """
 
+    __slots__ = ('_atom', '_position')
+
     def __init__(self, atom, position):
         """
         Initialize a :class:`PositionedAtom`.
@@ -104,15 +113,91 @@ class Network:
     """
     Definition of a network of an stk.Molecule.
 
+    The network is stored as arrays: the atoms and their positions,
+    one row per atom, and a compressed sparse row (CSR) adjacency
+    matrix with bond orders and periodicities parallel to its column
+    indices. The :mod:`networkx` graph is only built when it is
+    requested.
+
     """
 
     def __init__(self, graph):
         """
         Initialize a Network from a networkx.graph.
 
+        Parameters
+        ----------
+        graph : :class:`networkx.Graph`
+            A graph with :class:`.PositionedAtom` nodes. Edges may
+            hold ``'order'`` and ``'periodicity'`` data, which
+            default to ``1`` and ``(0, 0, 0)``. The graph is not
+            held by the network, so later changes to it do not
+            affect the network.
+
         """
 
-        self._graph = graph
+        nodes = tuple(graph.nodes)
+        node_rows = {node: row for row, node in enumerate(nodes)}
+        edges = tuple(graph.edges(data=True))
+        self._init_from_arrays(
+            atoms=tuple(node.get_atom() for node in nodes),
+            positions=np.array(
+                [node.get_position() for node in nodes],
+                dtype=np.float64,
+            ).reshape(-1, 3),
+            bond_rows=np.array(
+                [(node_rows[u], node_rows[v]) for u, v, _ in edges],
+                dtype=np.int64,
+            ).reshape(-1, 2),
+            orders=[data.get('order', 1) for *_, data in edges],
+            periodicities=[
+                data.get('periodicity', (0, 0, 0))
+                for *_, data in edges
+            ],
+        )
+        # The networkx graph is rebuilt from the arrays when needed,
+        # so that it always matches them.
+        self._nodes = nodes
+
+    def _init_from_arrays(
+        self,
+        atoms,
+        positions,
+        bond_rows,
+        orders,
+        periodicities,
+    ):
+        num_atoms = len(atoms)
+        # Each bond is stored in both directions, so that each row of
+        # the CSR matrix holds all the neighbours of an atom.
+        indptr, indices, entry_order = _build_csr(
+            rows=np.concatenate((bond_rows[:, 0], bond_rows[:, 1])),
+            cols=np.concatenate((bond_rows[:, 1], bond_rows[:, 0])),
+            num_rows=num_atoms,
+        )
+
+        self._atoms = atoms
+        self._ids = np.fromiter(
+            (atom.get_id() for atom in atoms),
+            dtype=np.int64,
+            count=num_atoms,
+        )
+        self._positions = positions
+        self._indptr = indptr
+        self._indices = indices
+        # Bond orders can be a mix of int and float, keep them as
+        # given.
+        self._order = np.tile(
+            np.array(orders, dtype=object),
+            2,
+        )[entry_order]
+        self._periodicity = np.tile(
+            np.array(periodicities, dtype=np.int64).reshape(-1, 3),
+            (2, 1),
+        )[entry_order]
+        self._nodes = None
+        self._graph = None
+        self._labels = None
 
     @classmethod
     def init_from_molecule(cls, molecule):
@@ -121,38 +206,105 @@ class Network:
 
         """
 
-        g = nx.Graph()
+        atoms = tuple(molecule.get_atoms())
+        atom_ids = np.fromiter(
+            (atom.get_id() for atom in atoms),
+            dtype=np.int64,
+            count=len(atoms),
+        )
+        id_to_row = np.empty(
+            atom_ids.max(initial=-1)+1,
+            dtype=np.int64,
+        )
+        id_to_row[atom_ids] = np.arange(len(atoms))
+
+        bonds = tuple(molecule.get_bonds())
+        bond_ids = np.array(
+            [
+                (bond.get_atom1().get_id(), bond.get_atom2().get_id())
+                for bond in bonds
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+        network = cls.__new__(cls)
+        network._init_from_arrays(
+            atoms=atoms,
+            # Gather the positions of all atoms in one indexing
+            # operation.
+            positions=molecule.get_position_matrix()[atom_ids],
+            bond_rows=id_to_row[bond_ids],
+            orders=[bond.get_order() for bond in bonds],
+            periodicities=[bond.get_periodicity() for bond in bonds],
+        )
+        return network
+
+    def _get_nodes(self):
+        if self._nodes is None:
+            self._nodes = tuple(
+                PositionedAtom(atom, tuple(position))
+                for atom, position in zip(
+                    self._atoms,
+                    self._positions.tolist(),
+                )
+            )
+        return self._nodes
 
-        pos_mat = molecule.get_position_matrix()
-        for atom in molecule.get_atoms():
-            pos = tuple(float(i) for i in pos_mat[atom.get_id()])
-            pa = PositionedAtom(atom, pos)
-            g.add_node(pa)
+    def _get_entry_rows(self):
+        """
+        Get the row of each entry in the CSR adjacency matrix.
 
-        # Define edges.
-        for bond in molecule.get_bonds():
-            n1, n2 = [
-                i for i in g.nodes
-                if i.get_id() in (
-                    bond.get_atom1().get_id(),
-                    bond.get_atom2().get_id(),
-                )
-            ]
+        """
 
-            g.add_edge(
-                n1, n2,
-                order=bond.get_order(),
-                periodicity=bond.get_periodicity(),
-            )
+        return np.repeat(
+            np.arange(len(self._atoms)),
+            np.diff(self._indptr),
+        )
 
-        return cls(g)
+    def _get_csr_matrix(self):
+        num_atoms = len(self._atoms)
+        return csr_matrix(
+            (
+                np.ones(len(self._indices), dtype=np.int8),
+                self._indices,
+                self._indptr,
+            ),
+            shape=(num_atoms, num_atoms),
+        )
 
     def get_graph(self):
         """
         Return a networkx.graph.
 
+        The graph is built on the first call and reused afterwards.
+
         """
 
+        if self._graph is None:
+            nodes = self._get_nodes()
+            rows = self._get_entry_rows()
+            # Each bond appears twice in the adjacency matrix, keep
+            # one copy.
+            (entries, ) = np.nonzero(rows < self._indices)
+            graph = nx.Graph()
+            graph.add_nodes_from(nodes)
+            graph.add_edges_from(
+                (
+                    nodes[row],
+                    nodes[col],
+                    {
+                        'order': order,
+                        'periodicity': tuple(periodicity),
+                    },
+                )
+                for row, col, order, periodicity in zip(
+                    rows[entries].tolist(),
+                    self._indices[entries].tolist(),
+                    self._order[entries].tolist(),
+                    self._periodicity[entries].tolist(),
+                )
+            )
+            self._graph = graph
         return self._graph
 
     def get_nodes(self):
@@ -161,8 +313,7 @@ class Network:
 
         """
 
-        for i in self._graph.nodes:
-            yield i
+        yield from self._get_nodes()
 
     def clone(self):
         """
@@ -171,22 +322,42 @@ class Network:
         """
 
         clone = self.__class__.__new__(self.__class__)
-        Network.__init__(self=clone, graph=self._graph)
+        clone._atoms = self._atoms
+        clone._ids = self._ids
+        clone._positions = self._positions
+        clone._indptr = self._indptr
+        clone._indices = self._indices
+        clone._order = self._order
+        clone._periodicity = self._periodicity
+        clone._nodes = self._nodes
+        clone._graph = self._graph
+        clone._labels = self._labels
         return clone
 
     def _with_deleted_bonds(self, atom_ids):
-        sorted_set = {tuple(sorted(i)) for i in atom_ids}
-        to_delete = []
-        for edge in self._graph.edges:
-            a1id = edge[0].get_id()
-            a2id = edge[1].get_id()
-            pair = tuple(sorted((a1id, a2id)))
-            if pair in sorted_set:
-                to_delete.append(edge)
-
-        for id1, id2 in to_delete:
-            self._graph.remove_edge(id1, id2)
-
+        pairs = np.array(
+            [tuple(pair) for pair in atom_ids],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        rows = self._get_entry_rows()
+        keep = np.isin(
+            element=_pack_pairs(
+                self._ids[rows],
+                self._ids[self._indices],
+            ),
+            test_elements=_pack_pairs(pairs[:, 0], pairs[:, 1]),
+            invert=True,
+        )
+        # The graph and components only change if a bond is removed.
+        if keep.all():
+            return self
+
+        self._indptr = _get_indptr(rows[keep], len(self._atoms))
+        self._indices = self._indices[keep]
+        self._order = self._order[keep]
+        self._periodicity = self._periodicity[keep]
+        self._graph = None
+        self._labels = None
         return self
 
     def with_deleted_bonds(self, atom_ids):
@@ -197,23 +368,71 @@ class Network:
 
         return self.clone()._with_deleted_bonds(atom_ids)
 
-    def get_connected_components(self):
+    def get_fragment_labels(self):
+        """
+        Get the connected component each atom belongs to.
+
+        This does not build the :mod:`networkx` graph, so it is
+        cheaper than :meth:`get_connected_components` when only the
+        grouping of atoms is needed. The labels are computed once
+        and shared with clones until a bond is deleted.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` of :class:`int`
+            The component label of each atom, in the order of
+            :meth:`get_nodes`. Components are labelled from ``0``
+            in the order of their first atom.
+
+        """
+
+        if self._labels is None:
+            _, labels = connected_components(
+                csgraph=self._get_csr_matrix(),
+                directed=False,
+            )
+            labels.setflags(write=False)
+            self._labels = labels
+        return self._labels
+
+    def get_connected_components(self, copy=False):
         """
         Get connected components within full graph.
 
+        Parameters
+        ----------
+        copy : :class:`bool`, optional
+            If ``True``, each component is returned as an independent
+            copy of its part of the graph, which can be modified. If
+            ``False``, read-only subgraph views are returned.
+
         Returns
         -------
         :class:`list` of :class:`networkx.graph`
-            List of connected components of graph.
+            List of connected components of graph. The components
+            are ordered by the position of their first atom in the
+            network, so for a :class:`stk.Molecule`, by their lowest
+            atom id.
 
         """
 
-        return [
-            self._graph.subgraph(c).copy()
-            for c in sorted(
-                nx.connected_components(self._graph)
-            )
+        labels = self.get_fragment_labels()
+        if len(labels) == 0:
+            return []
+
+        graph = self.get_graph()
+        nodes = self._get_nodes()
+        # Group the rows by component with a single sort, components
+        # are labelled in the order their first atom appears.
+        rows_by_label = np.argsort(labels, kind='stable')
+        boundaries = np.cumsum(np.bincount(labels))[:-1]
+        components = [
+            graph.subgraph(nodes[row] for row in component.tolist())
+            for component in np.split(rows_by_label, boundaries)
         ]
+        if copy:
+            return [component.copy() for component in components]
+        return components
 
     def __str__(self):
         return repr(self)
@@ -221,6 +440,68 @@ class Network:
     def __repr__(self):
         return (
             f'{self.__class__.__name__}('
-            f'n={self._graph.number_of_nodes()}, '
-            f'e={self._graph.number_of_edges()})'
+            f'n={len(self._atoms)}, '
+            f'e={len(self._indices) // 2})'
         )
+
+
+def _get_indptr(rows, num_rows):
+    """
+    Get the CSR row pointer array for entries in `rows`.
+
+    """
+
+    indptr = np.zeros(num_rows+1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+    return indptr
+
+
+def _build_csr(rows, cols, num_rows):
+    """
+    Build a CSR adjacency matrix from a list of entries.
+
+    Parameters
+    ----------
+    rows : :class:`numpy.ndarray` of :class:`int`
+        The row of each entry.
+
+    cols : :class:`numpy.ndarray` of :class:`int`
+        The column of each entry.
+
+    num_rows : :class:`int`
+        The number of rows in the matrix.
+
+    Returns
+    -------
+    indptr : :class:`numpy.ndarray` of :class:`int`
+        The row pointer array.
+
+    indices : :class:`numpy.ndarray` of :class:`int`
+        The column of each entry, sorted by row.
+
+    entry_order : :class:`numpy.ndarray` of :class:`int`
+        The indices which sort the entries by row. Applying it to
+        any array parallel to `rows` aligns that array with
+        `indices`.
+
+    """
+
+    entry_order = np.argsort(rows, kind='stable')
+    return _get_indptr(rows, num_rows), cols[entry_order], entry_order
+
+
+def _pack_pairs(ids1, ids2):
+    """
+    Pack unordered pairs of atom ids into single integers.
+
+    The smaller id of each pair is placed in the upper 32 bits, so
+    that a pair and its reverse give the same value.
+
+    """
+
+    ids1 = ids1.astype(np.uint64)
+    ids2 = ids2.astype(np.uint64)
+    return (
+        (np.minimum(ids1, ids2) << np.uint64(32))
+        | np.maximum(ids1, ids2)
+    )
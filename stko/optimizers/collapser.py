@@ -13,7 +13,7 @@ import logging
 from itertools import combinations
 import numpy as np
 from collections import defaultdict
-from scipy.spatial.distance import pdist
+from scipy.spatial.distance import pdist, cdist
 import random
 import matplotlib.pyplot as plt
 import uuid
@@ -113,26 +113,25 @@ class Collapser(Optimizer):
         """
 
         position_matrix = mol.get_position_matrix()
-
-        for atom1, atom2 in combinations(mol.get_atom_infos(), 2):
-            chk1 = (
-                atom1.get_atom().get_id() != atom2.get_atom().get_id()
-            )
-            chk2 = (
-                atom1.get_atom().get_atomic_number() != 1
-                and atom2.get_atom().get_atomic_number() != 1
-            )
-            chk3 = (
-                atom1.get_building_block_id() !=
-                atom2.get_building_block_id()
-            )
-            if chk1 and chk2 and chk3:
-                dist = get_atom_distance(
-                    position_matrix=position_matrix,
-                    atom1_id=atom1.get_atom().get_id(),
-                    atom2_id=atom2.get_atom().get_id()
+        # Group the atoms by building block, so that the distances
+        # between each pair of building blocks are calculated, and
+        # can be checked, one pair at a time.
+        bb_atom_ids = defaultdict(list)
+        for atom_info in mol.get_atom_infos():
+            atom = atom_info.get_atom()
+            if atom.get_atomic_number() != 1:
+                bb_atom_ids[atom_info.get_building_block_id()].append(
+                    atom.get_id()
                 )
-                yield dist
+
+        for atom_ids1, atom_ids2 in combinations(
+            bb_atom_ids.values(),
+            2,
+        ):
+            yield from cdist(
+                position_matrix[atom_ids1],
+                position_matrix[atom_ids2],
+            ).ravel().tolist()
 
     def _has_short_contacts(self, mol):
         """
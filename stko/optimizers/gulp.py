@@ -110,6 +110,7 @@ import uuid
 import os
 import shutil
 import subprocess as sp
+import numpy as np
 from rdkit.Chem import AllChem as rdkit
 
 from .optimizers import Optimizer
@@ -1091,19 +1092,18 @@ class GulpUFFMDOptimizer(GulpUFFOptimizer):
         min_energy = 1E10
         for ts in trajectory_data:
             if self._save_conformers:
-                conformer_file_name = f'conf_{ts}.xyz'
-            else:
-                # This will get overwrriten each time and deleted at
-                # the end.
-                conformer_file_name = 'temp_conf.xyz'
+                self._write_conformer_xyz_file(
+                    ts=ts,
+                    ts_data=trajectory_data[ts],
+                    filename=f'conf_{ts}.xyz',
+                    atom_types=atom_types
+                )
 
-            self._write_conformer_xyz_file(
-                ts=ts,
-                ts_data=trajectory_data[ts],
-                filename=conformer_file_name,
-                atom_types=atom_types
+            # Update the structure in memory, rather than writing and
+            # reading back a conformer file.
+            mol = mol.with_position_matrix(
+                np.array(trajectory_data[ts]['coords'], dtype=float)
             )
-            mol = mol.with_structure_from_file(conformer_file_name)
             conformer_opt_dir = os.path.join(
                 os.getcwd(),
                 f'conf_{ts}_opt'
@@ -1126,9 +1126,6 @@ class GulpUFFMDOptimizer(GulpUFFOptimizer):
                 # Write out optimised conformer.
                 mol.write(low_conf_xyz)
 
-        if not self._save_conformers:
-            os.remove('temp_conf.xyz')
-
     def _save_all_conformers(self, trajectory_data, atom_types):
         for ts in trajectory_data:
             conformer_file_name = f'conf_{ts}.xyz'
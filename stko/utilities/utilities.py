@@ -13,11 +13,11 @@ import shutil
 import os
 import subprocess as sp
 import gzip
+import math
+import mmap
 import re
-from collections import deque, defaultdict
-from glob import iglob
+from collections import defaultdict
 from itertools import chain
-from scipy.spatial.distance import euclidean
 
 
 # This dictionary gives easy access to the rdkit bond types.
@@ -55,6 +55,16 @@ periodic_table = {
     117: 'Uus', 118: 'Uuo'
 }
 
+# Matches the curly braces which delimit the sections of a ``.mae``
+# file.
+_mae_brace = re.compile(r'[{}]')
+_mae_brace_bytes = re.compile(rb'[{}]')
+
+# The atomic numbers of the transition metals.
+_metal_atomic_numbers = frozenset(
+    chain(range(21, 31), range(39, 49), range(72, 81))
+)
+
 
 class MAEExtractor:
     """
@@ -123,12 +133,15 @@ class MAEExtractor:
 
         """
 
+        # Reading the .mae file and splitting it into structure blocks
+        # only needs to happen once for all conformers.
+        confs = self.lowest_energy_conformers(n)
+        content = self.content.split("f_m_ct")
         for i in range(n):
             # Get the id of the lowest energy conformer.
-            num = self.lowest_energy_conformers(n)[i][1]
+            num = confs[i][1]
             # Get the structure block corresponding to the lowest
             # energy conformer.
-            content = self.content.split("f_m_ct")
             new_mae = "f_m_ct".join([content[0], content[num]])
 
             # Write the structure block in its own .mae file, named
@@ -171,10 +184,17 @@ class MAEExtractor:
         """
 
         block = block.split(":::")
-        for name, value in zip(block[0].split('\n'),
-                               block[1].split('\n')):
-            if 'r_mmod_Potential_Energy' in name:
-                return float(value)
+        names, values = block[0], block[1]
+        start = names.find('r_mmod_Potential_Energy')
+        if start == -1:
+            return None
+
+        # The value is on the same line of the value section as the
+        # name is in the name section, so only split up to it.
+        line = names.count('\n', 0, start)
+        values = values.split('\n', line+1)
+        if line < len(values):
+            return float(values[line])
 
     def lowest_energy_conformers(self, n):
         """
@@ -203,25 +223,22 @@ class MAEExtractor:
         # content.
         with open(self.mae_path, 'r') as mae_file:
             self.content = mae_file.read()
-            # Split the content across curly braces. This divides the
-            # various sections of the .mae file.
-            content_split = re.split(r"[{}]", self.content)
 
         # Go through all the datablocks in the the .mae file. For each
         # energy block extract the energy and store it in the
         # `energies` list. Store the `index`  (conformer id) along with
         # each extracted energy.
         self.energies = []
-        prev_block = deque([""], maxlen=1)
+        prev_block = ""
         index = 1
-        for block in content_split:
-            if ("f_m_ct" in prev_block[0] and
+        for block in _iter_mae_blocks(self.content):
+            if ("f_m_ct" in prev_block and
                "r_mmod_Potential_Energy" in block):
                 energy = self.extract_energy(block)
                 self.energies.append((energy, index))
                 index += 1
 
-            prev_block.append(block)
+            prev_block = block
 
         # Selecting the lowest energy n conformers
         confs = sorted(self.energies)[:n]
@@ -231,10 +248,43 @@ class MAEExtractor:
         # conformers.
         return confs
 
+    def _decompress_maegz(self):
+        """
+        Decompresses the .maegz file with an external program.
+
+        ``pigz`` is tried first, followed by ``gunzip``.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if one of the programs decompressed the file.
+
+        """
+
+        for program in ('pigz', 'gunzip'):
+            program_path = shutil.which(program)
+            if program_path is None:
+                continue
+
+            with open(self.mae_path, 'wb') as mae_file:
+                process = sp.run(
+                    [program_path, '-dc', self.maegz_path],
+                    stdout=mae_file,
+                    stderr=sp.PIPE,
+                )
+            if process.returncode == 0:
+                return True
+
+        return False
+
     def maegz_to_mae(self):
         """
         Converts the .maegz file to a .mae file.
 
+        Large conformer searches produce large files, so ``pigz`` or
+        ``gunzip`` are used when available. Otherwise, the file is
+        decompressed with :mod:`gzip`.
+
         Returns
         -------
         None : :class:`NoneType`
@@ -242,9 +292,84 @@ class MAEExtractor:
         """
 
         self.mae_path = self.maegz_path.replace('.maegz', '.mae')
-        with gzip.open(self.maegz_path, 'r') as maegz_file:
+        if self._decompress_maegz():
+            return
+
+        with gzip.open(self.maegz_path, 'rb') as maegz_file:
             with open(self.mae_path, 'wb') as mae_file:
-                mae_file.write(maegz_file.read())
+                # Decompress in chunks, rather than holding the entire
+                # decompressed file in memory.
+                shutil.copyfileobj(maegz_file, mae_file, 1024*1024)
+
+
+def _iter_mae_blocks(content):
+    """
+    Yield the sections of ``.mae`` file content.
+
+    The sections are the pieces of `content` between curly braces,
+    the same as ``re.split(r'[{}]', content)``. However, each one is
+    only sliced out of `content` when it is reached, rather than
+    creating a list of all of them.
+
+    Parameters
+    ----------
+    content : :class:`str` or :class:`bytes`-like
+        The content of a ``.mae`` file. This can also be the raw
+        bytes of the file, for example a :class:`mmap.mmap`.
+
+    Yields
+    ------
+    :class:`str` or :class:`bytes`
+        A section of `content`, of the same type as `content`.
+
+    """
+
+    if isinstance(content, str):
+        brace_pattern = _mae_brace
+    else:
+        brace_pattern = _mae_brace_bytes
+
+    start = 0
+    for brace in brace_pattern.finditer(content):
+        yield content[start:brace.start()]
+        start = brace.end()
+    yield content[start:]
+
+
+def _get_mae_columns(labels, keys):
+    """
+    Find the columns of a ``.mae`` table which hold some properties.
+
+    A column holds a property if its label contains the key of the
+    property. If several labels contain a key, the last one is used.
+
+    Parameters
+    ----------
+    labels : :class:`list` of :class:`str`
+        The column labels of the table.
+
+    keys : :class:`tuple` of :class:`str`
+        The keys of the properties.
+
+    Returns
+    -------
+    :class:`list` of :class:`int`
+        The column of each property in `keys`.
+
+    Raises
+    ------
+    :class:`RuntimeError`
+        If no label contains one of the `keys`.
+
+    """
+
+    columns = []
+    for key in keys:
+        matches = [i for i, label in enumerate(labels) if key in label]
+        if not matches:
+            raise RuntimeError(f'No {key} column in .mae file.')
+        columns.append(matches[-1])
+    return columns
 
 
 def kill_macromodel():
@@ -310,41 +435,52 @@ def mol_from_mae_file(mae_path):
     mol = rdkit.EditableMol(rdkit.Mol())
     conf = rdkit.Conformer()
 
-    with open(mae_path, 'r') as mae:
-        content = re.split(r'[{}]', mae.read())
-
-    prev_block = deque([''], maxlen=1)
-    for block in content:
-        if 'm_atom[' in prev_block[0]:
-            atom_block = block
-        if 'm_bond[' in prev_block[0]:
-            bond_block = block
-        prev_block.append(block)
+    # Only the atom and bond blocks are needed, so search the raw
+    # bytes of the file and decode just those two blocks.
+    with open(mae_path, 'rb') as mae, mmap.mmap(
+        fileno=mae.fileno(),
+        length=0,
+        access=mmap.ACCESS_READ,
+    ) as content:
+        prev_block = b''
+        for block in _iter_mae_blocks(content):
+            if b'm_atom[' in prev_block:
+                atom_block = block.decode()
+            if b'm_bond[' in prev_block:
+                bond_block = block.decode()
+            prev_block = block
 
     labels, data_block, *_ = atom_block.split(':::')
     labels = [label for label in labels.split('\n')
               if not label.isspace() and label != '']
+    columns = _get_mae_columns(
+        labels=labels,
+        keys=('x_coord', 'y_coord', 'z_coord', 'atomic_number'),
+    )
 
     data_block = [a.split() for a in data_block.split('\n') if
                   not a.isspace() and a != '']
 
+    atom_table = []
     for line in data_block:
         line = [word for word in line if word != '"']
         if len(labels) != len(line):
             raise RuntimeError(('Number of labels does'
                                 ' not match number of columns'
                                 ' in .mae file.'))
-
-        for label, data in zip(labels, line):
-            if 'x_coord' in label:
-                x = float(data)
-            if 'y_coord' in label:
-                y = float(data)
-            if 'z_coord' in label:
-                z = float(data)
-            if 'atomic_number' in label:
-                atom_num = int(data)
-
+        atom_table.append([line[column] for column in columns])
+
+    # Convert each column in one go, rather than word by word.
+    atom_table = np.array(atom_table, dtype=str).reshape(-1, 4)
+    coords = atom_table[:, :3].astype(np.float64)
+    atomic_numbers = atom_table[:, 3].astype(np.int64)
+
+    # Convert to lists once, so that the loop works on plain Python
+    # numbers rather than numpy scalars.
+    for (x, y, z), atom_num in zip(
+        coords.tolist(),
+        atomic_numbers.tolist(),
+    ):
         atom_sym = periodic_table[atom_num]
         atom_coord = Point3D(x, y, z)
         atom_id = mol.AddAtom(rdkit.Atom(atom_sym))
@@ -353,23 +489,27 @@ def mol_from_mae_file(mae_path):
     labels, data_block, *_ = bond_block.split(':::')
     labels = [label for label in labels.split('\n')
               if not label.isspace() and label != '']
+    columns = _get_mae_columns(
+        labels=labels,
+        keys=('from', 'to', 'order'),
+    )
     data_block = [a.split() for a in data_block.split('\n')
                   if not a.isspace() and a != '']
 
+    bond_table = []
     for line in data_block:
         if len(labels) != len(line):
             raise RuntimeError(('Number of labels does'
                                 ' not match number of '
                                 'columns in .mae file.'))
+        bond_table.append([line[column] for column in columns])
 
-        for label, data in zip(labels, line):
-            if 'from' in label:
-                atom1 = int(data) - 1
-            if 'to' in label:
-                atom2 = int(data) - 1
-            if 'order' in label:
-                bond_order = str(int(data))
-        mol.AddBond(atom1, atom2, bond_dict[bond_order])
+    bond_table = np.array(bond_table, dtype=str).reshape(-1, 3)
+    bond_table = bond_table.astype(np.int64)
+    bond_table[:, :2] -= 1
+
+    for atom1, atom2, bond_order in bond_table.tolist():
+        mol.AddBond(atom1, atom2, bond_dict[str(bond_order)])
 
     mol = mol.GetMol()
     mol.AddConformer(conf)
@@ -377,10 +517,19 @@ def mol_from_mae_file(mae_path):
 
 
 def move_generated_macromodel_files(basename, output_dir):
-    if not os.path.exists(output_dir):
-        os.mkdir(output_dir)
-
-    for filename in iglob(f'{basename}*'):
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Read the directory once and match the names by prefix, rather
+    # than matching a glob pattern against every entry.
+    directory, prefix = os.path.split(basename)
+    with os.scandir(directory or '.') as entries:
+        filenames = [
+            os.path.join(directory, entry.name)
+            for entry in entries
+            if entry.name.startswith(prefix)
+        ]
+
+    for filename in filenames:
         # Do not move the output_dir.
         if filename == output_dir:
             continue
@@ -391,6 +540,37 @@ class XTBInvalidSolventError(Exception):
     ...
 
 
+_xtb_alpb_solvents = frozenset({
+    'acetone', 'acetonitrile', 'aniline', 'benzaldehyde',
+    'benzene', 'CH2Cl2'.lower(), 'CHCl3'.lower(),
+    'CS2'.lower(), 'dioxane', 'DMF'.lower(), 'DMSO'.lower(),
+    'ether', 'ethylacetate', 'furane',
+    'hexandecane', 'hexane', 'H2O'.lower(), 'nitromethane',
+    'octanol', 'octanol (wet)', 'phenol', 'THF'.lower(),
+    'toluene', 'water',
+})
+
+# Maps the GFN version and the solvent model to the valid solvents.
+# GFN0 has no valid solvents.
+_xtb_solvents = {
+    (1, 'gbsa'): frozenset({
+        'acetone', 'acetonitrile', 'benzene',
+        'CH2Cl2'.lower(), 'CHCl3'.lower(), 'CS2'.lower(),
+        'DMSO'.lower(), 'ether', 'H2O'.lower(),
+        'methanol', 'THF'.lower(), 'toluene', 'water',
+    }),
+    (1, 'alpb'): _xtb_alpb_solvents,
+    (2, 'gbsa'): frozenset({
+        'acetone', 'acetonitrile',
+        'benzene', 'CH2Cl2'.lower(), 'CHCl3'.lower(),
+        'CS2'.lower(), 'DMSO'.lower(),
+        'ether', 'hexane', 'methanol', 'H2O'.lower(),
+        'THF'.lower(), 'toluene', 'water',
+    }),
+    (2, 'alpb'): _xtb_alpb_solvents,
+}
+
+
 def is_valid_xtb_solvent(gfn_version, solvent_model, solvent):
     """
     Check if solvent is valid for the given GFN version.
@@ -417,49 +597,37 @@ def is_valid_xtb_solvent(gfn_version, solvent_model, solvent):
 
     """
 
-    if gfn_version == 0:
-        return False
-    elif gfn_version == 1 and solvent_model == 'gbsa':
-        valid_solvents = {
-            'acetone', 'acetonitrile', 'benzene',
-            'CH2Cl2'.lower(), 'CHCl3'.lower(), 'CS2'.lower(),
-            'DMSO'.lower(), 'ether', 'H2O'.lower(),
-            'methanol', 'THF'.lower(), 'toluene', 'water',
-        }
-    elif gfn_version == 1 and solvent_model == 'alpb':
-        valid_solvents = {
-            'acetone', 'acetonitrile', 'aniline', 'benzaldehyde',
-            'benzene', 'CH2Cl2'.lower(), 'CHCl3'.lower(),
-            'CS2'.lower(), 'dioxane', 'DMF'.lower(), 'DMSO'.lower(),
-            'ether', 'ethylacetate', 'furane',
-            'hexandecane', 'hexane', 'H2O'.lower(), 'nitromethane',
-            'octanol', 'octanol (wet)', 'phenol', 'THF'.lower(),
-            'toluene', 'water',
-        }
-    elif gfn_version == 2 and solvent_model == 'gbsa':
-        valid_solvents = {
-            'acetone', 'acetonitrile',
-            'benzene', 'CH2Cl2'.lower(), 'CHCl3'.lower(),
-            'CS2'.lower(), 'DMSO'.lower(),
-            'ether', 'hexane', 'methanol', 'H2O'.lower(),
-            'THF'.lower(), 'toluene', 'water',
-        }
-    elif gfn_version == 2 and solvent_model == 'alpb':
-        valid_solvents = {
-            'acetone', 'acetonitrile', 'aniline', 'benzaldehyde',
-            'benzene', 'CH2Cl2'.lower(), 'CHCl3'.lower(),
-            'CS2'.lower(), 'dioxane', 'DMF'.lower(), 'DMSO'.lower(),
-            'ether', 'ethylacetate', 'furane',
-            'hexandecane', 'hexane', 'H2O'.lower(), 'nitromethane',
-            'octanol', 'octanol (wet)', 'phenol', 'THF'.lower(),
-            'toluene', 'water',
-        }
+    valid_solvents = _xtb_solvents.get(
+        (gfn_version, solvent_model),
+        frozenset(),
+    )
     return solvent in valid_solvents
 
 
 def get_plane_normal(points):
-    centroid = points.sum(axis=0) / len(points)
-    return np.linalg.svd(points - centroid)[-1][2, :]
+    """
+    Get the normal of the plane of best fit through `points`.
+
+    The normal is the eigenvector of the 3x3 scatter matrix of the
+    centred points with the smallest eigenvalue. The sign of the
+    normal is arbitrary.
+
+    Parameters
+    ----------
+    points : :class:`numpy.ndarray`
+        An (N, 3) array of points.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The unit normal of the plane.
+
+    """
+
+    centred = points - points.mean(axis=0)
+    # Eigenvalues are returned in ascending order.
+    _, eigenvectors = np.linalg.eigh(centred.T @ centred)
+    return eigenvectors[:, 0]
 
 
 def has_h_atom(bond):
@@ -515,7 +683,7 @@ def has_metal_atom(bond, metal_atoms):
 
 def metal_atomic_numbers():
 
-    return chain(range(21, 31), range(39, 49), range(72, 81))
+    return _metal_atomic_numbers
 
 
 def get_metal_atoms(mol):
@@ -524,12 +692,10 @@ def get_metal_atoms(mol):
 
     """
 
-    metal_atoms = []
-    for atom in mol.get_atoms():
-        if atom.get_atomic_number() in metal_atomic_numbers():
-            metal_atoms.append(atom)
-
-    return metal_atoms
+    return [
+        atom for atom in mol.get_atoms()
+        if atom.get_atomic_number() in _metal_atomic_numbers
+    ]
 
 
 def get_metal_bonds(mol, metal_atoms):
@@ -538,13 +704,14 @@ def get_metal_bonds(mol, metal_atoms):
 
     """
 
+    metal_ids = frozenset(atom.get_id() for atom in metal_atoms)
     metal_bonds = []
     ids_to_metals = []
     for bond in mol.get_bonds():
-        if bond.get_atom1() in metal_atoms:
+        if bond.get_atom1().get_id() in metal_ids:
             metal_bonds.append(bond)
             ids_to_metals.append(bond.get_atom2().get_id())
-        elif bond.get_atom2() in metal_atoms:
+        elif bond.get_atom2().get_id() in metal_ids:
             metal_bonds.append(bond)
             ids_to_metals.append(bond.get_atom1().get_id())
 
@@ -572,9 +739,12 @@ def to_rdkit_mol_without_metals(mol, metal_atoms, metal_bonds):
         RDKit molecule with metal atoms replaced with H atoms.
 
     """
+    metal_ids = frozenset(atom.get_id() for atom in metal_atoms)
+    metal_bond_ids = frozenset(id(bond) for bond in metal_bonds)
+
     edit_mol = rdkit.EditableMol(rdkit.Mol())
     for atom in mol.get_atoms():
-        if atom in metal_atoms:
+        if atom.get_id() in metal_ids:
             # In place of metals, add H's that will be constrained.
             # This allows the atom ids to not be changed.
             rdkit_atom = rdkit.Atom(1)
@@ -585,7 +755,7 @@ def to_rdkit_mol_without_metals(mol, metal_atoms, metal_bonds):
         edit_mol.AddAtom(rdkit_atom)
 
     for bond in mol.get_bonds():
-        if bond in metal_bonds:
+        if id(bond) in metal_bond_ids:
             # Do not add bonds to metal atoms (replaced with H's).
             continue
         edit_mol.AddBond(
@@ -596,8 +766,9 @@ def to_rdkit_mol_without_metals(mol, metal_atoms, metal_bonds):
 
     edit_mol = edit_mol.GetMol()
     rdkit_conf = rdkit.Conformer(mol.get_num_atoms())
-    for atom_id, atom_coord in enumerate(mol.get_position_matrix()):
-        rdkit_conf.SetAtomPosition(atom_id, atom_coord)
+    positions = mol.get_position_matrix().tolist()
+    for atom_id, (x, y, z) in enumerate(positions):
+        rdkit_conf.SetAtomPosition(atom_id, Point3D(x, y, z))
         edit_mol.GetAtomWithIdx(atom_id).SetNoImplicit(True)
     edit_mol.AddConformer(rdkit_conf)
 
@@ -610,12 +781,46 @@ def get_atom_distance(position_matrix, atom1_id, atom2_id):
 
     """
 
-    distance = euclidean(
-        u=position_matrix[atom1_id],
-        v=position_matrix[atom2_id]
-    )
+    return float(np.linalg.norm(
+        position_matrix[atom1_id] - position_matrix[atom2_id]
+    ))
+
+
+def get_atom_distances(position_matrix, atom_pairs):
+    """
+    Return the distances between many pairs of atoms.
+
+    Parameters
+    ----------
+    position_matrix : :class:`numpy.ndarray`
+        The position matrix of the molecule.
+
+    atom_pairs : :class:`iterable` of :class:`tuple` of :class:`int`
+        The ids of the atoms in each pair. This can also be a
+        :class:`numpy.ndarray` of shape ``(n, 2)``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The distance between the atoms of each pair.
+
+    """
 
-    return float(distance)
+    if isinstance(atom_pairs, np.ndarray):
+        atom_pairs = atom_pairs.astype(np.int64, copy=False)
+    else:
+        # Read the ids straight into an array, without building an
+        # intermediate list.
+        atom_pairs = np.fromiter(
+            chain.from_iterable(atom_pairs),
+            dtype=np.int64,
+        )
+    atom_pairs = atom_pairs.reshape(-1, 2)
+    return np.linalg.norm(
+        position_matrix[atom_pairs[:, 0]]
+        - position_matrix[atom_pairs[:, 1]],
+        axis=1,
+    )
 
 
 def get_long_bond_ids(mol, reorder=False):
@@ -627,24 +832,13 @@ def get_long_bond_ids(mol, reorder=False):
     long_bond_ids = []
     for bond_infos in mol.get_bond_infos():
         if bond_infos.get_building_block() is None:
+            bond = bond_infos.get_bond()
+            ids = (
+                bond.get_atom1().get_id(),
+                bond.get_atom2().get_id(),
+            )
             if reorder:
-                ba1 = bond_infos.get_bond().get_atom1().get_id()
-                ba2 = bond_infos.get_bond().get_atom2().get_id()
-                if ba1 < ba2:
-                    ids = (
-                        bond_infos.get_bond().get_atom1().get_id(),
-                        bond_infos.get_bond().get_atom2().get_id(),
-                    )
-                else:
-                    ids = (
-                        bond_infos.get_bond().get_atom2().get_id(),
-                        bond_infos.get_bond().get_atom1().get_id(),
-                    )
-            else:
-                ids = (
-                    bond_infos.get_bond().get_atom1().get_id(),
-                    bond_infos.get_bond().get_atom2().get_id(),
-                )
+                ids = (min(ids), max(ids))
             long_bond_ids.append(ids)
 
     return tuple(long_bond_ids)
@@ -662,36 +856,116 @@ def calculate_dihedral(pt1, pt2, pt3, pt4):
     coordinates-in-python
     (new_dihedral(p))
 
+    If `pt2` and `pt3` are the same point, the dihedral is undefined
+    and ``nan`` is returned.
+
     """
 
-    p0 = np.asarray(pt1)
-    p1 = np.asarray(pt2)
-    p2 = np.asarray(pt3)
-    p3 = np.asarray(pt4)
+    # The points are only 3D, so plain float arithmetic is much
+    # cheaper than dispatching numpy operations on tiny arrays.
+    p0, p1, p2, p3 = (
+        tuple(float(i) for i in pt) for pt in (pt1, pt2, pt3, pt4)
+    )
 
-    b0 = -1.0 * (p1 - p0)
-    b1 = p2 - p1
-    b2 = p3 - p2
+    b0 = _subtract(p0, p1)
+    b1 = _subtract(p2, p1)
+    b2 = _subtract(p3, p2)
 
     # normalize b1 so that it does not influence magnitude of vector
     # rejections that come next
-    b1 /= np.linalg.norm(b1)
+    b1_norm = math.sqrt(_dot(b1, b1))
+    if b1_norm == 0:
+        return math.nan
+    b1 = tuple(i / b1_norm for i in b1)
 
     # vector rejections
     # v = projection of b0 onto plane perpendicular to b1
     #   = b0 minus component that aligns with b1
     # w = projection of b2 onto plane perpendicular to b1
     #   = b2 minus component that aligns with b1
-    v = b0 - np.dot(b0, b1) * b1
-    w = b2 - np.dot(b2, b1) * b1
+    b0_b1 = _dot(b0, b1)
+    b2_b1 = _dot(b2, b1)
+    v = tuple(i - b0_b1 * j for i, j in zip(b0, b1))
+    w = tuple(i - b2_b1 * j for i, j in zip(b2, b1))
 
     # angle between v and w in a plane is the torsion angle
     # v and w may not be normalized but that's fine since tan is y/x
-    x = np.dot(v, w)
-    y = np.dot(np.cross(b1, v), w)
+    x = _dot(v, w)
+    y = _dot(_cross(b1, v), w)
+    return math.degrees(math.atan2(y, x))
+
+
+def calculate_dihedrals(position_matrix, atom_ids):
+    """
+    Calculate the dihedrals of many sets of four atoms.
+
+    Vectorised version of :func:`calculate_dihedral`.
+
+    Parameters
+    ----------
+    position_matrix : :class:`numpy.ndarray`
+        The position matrix of the molecule.
+
+    atom_ids : :class:`iterable` of :class:`tuple` of :class:`int`
+        The ids of the four atoms defining each dihedral.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The dihedral of each set of atoms in degrees, in the range
+        (-180, 180]. As in :func:`calculate_dihedral`, it is ``nan``
+        if the second and third atoms are at the same position.
+
+    """
+
+    atom_ids = np.array(
+        [tuple(ids) for ids in atom_ids],
+        dtype=np.int64,
+    ).reshape(-1, 4)
+    p0, p1, p2, p3 = (
+        position_matrix[atom_ids[:, i]] for i in range(4)
+    )
+
+    b0 = p0 - p1
+    b1 = p2 - p1
+    b2 = p3 - p2
+    # Coincident central atoms give a zero norm, and so nan, which
+    # does not need a warning.
+    with np.errstate(invalid='ignore'):
+        b1 = b1 / np.linalg.norm(b1, axis=1, keepdims=True)
+
+    v = b0 - np.einsum('ij,ij->i', b0, b1)[:, np.newaxis] * b1
+    w = b2 - np.einsum('ij,ij->i', b2, b1)[:, np.newaxis] * b1
+
+    x = np.einsum('ij,ij->i', v, w)
+    y = np.einsum('ij,ij->i', np.cross(b1, v), w)
     return np.degrees(np.arctan2(y, x))
 
 
+def _subtract(vector1, vector2):
+    return (
+        vector1[0] - vector2[0],
+        vector1[1] - vector2[1],
+        vector1[2] - vector2[2],
+    )
+
+
+def _dot(vector1, vector2):
+    return (
+        vector1[0] * vector2[0]
+        + vector1[1] * vector2[1]
+        + vector1[2] * vector2[2]
+    )
+
+
+def _cross(vector1, vector2):
+    return (
+        vector1[1] * vector2[2] - vector1[2] * vector2[1],
+        vector1[2] * vector2[0] - vector1[0] * vector2[2],
+        vector1[0] * vector2[1] - vector1[1] * vector2[0],
+    )
+
+
 def vector_angle(vector1, vector2):
     """
     Returns the angle between two vectors in radians.
@@ -704,22 +978,27 @@ def vector_angle(vector1, vector2):
     Returns
     -------
     :class:`float`
-        The angle between `vector1` and `vector2` in radians.
+        The angle between `vector1` and `vector2` in radians. If
+        either vector has zero length, ``0`` is returned.
     """
 
-    if np.all(np.equal(vector1, vector2)):
+    # For short vectors, scalar math is faster than the general
+    # numpy routines.
+    numerator = float(np.dot(vector1, vector2))
+    denominator = math.sqrt(
+        float(np.dot(vector1, vector1))
+        * float(np.dot(vector2, vector2))
+    )
+    if denominator == 0:
         return 0.
-
-    numerator = np.dot(vector1, vector2)
-    denominator = np.linalg.norm(vector1) * np.linalg.norm(vector2)
     # This if statement prevents returns of NaN due to floating point
     # inaccuracy.
     term = numerator/denominator
     if term >= 1.:
         return 0.0
     if term <= -1.:
-        return np.pi
-    return np.arccos(term)
+        return math.pi
+    return math.acos(term)
 
 
 def get_torsion_info_angles(mol, torsion_info):
@@ -751,53 +1030,18 @@ def get_torsion_info_angles(mol, torsion_info):
     """
 
     torsion = torsion_info.get_torsion()
+    # Fetch all four positions with a single call.
     angle = calculate_dihedral(
-        pt1=tuple(
-            mol.get_atomic_positions(
-                torsion.get_atom_ids()[0]
-            )
-        )[0],
-        pt2=tuple(
-            mol.get_atomic_positions(
-                torsion.get_atom_ids()[1]
-            )
-        )[0],
-        pt3=tuple(
-            mol.get_atomic_positions(
-                torsion.get_atom_ids()[2]
-            )
-        )[0],
-        pt4=tuple(
-            mol.get_atomic_positions(
-                torsion.get_atom_ids()[3]
-            )
-        )[0],
+        *mol.get_atomic_positions(torsion.get_atom_ids())
     )
     bb_torsion = torsion_info.get_building_block_torsion()
     if bb_torsion is None:
         bb_angle = None
     else:
         bb_angle = calculate_dihedral(
-            pt1=tuple(
-                torsion_info.get_building_block().get_atomic_positions(
-                    bb_torsion.get_atom_ids()[0]
-                )
-            )[0],
-            pt2=tuple(
-                torsion_info.get_building_block().get_atomic_positions(
-                    bb_torsion.get_atom_ids()[1]
-                )
-            )[0],
-            pt3=tuple(
-                torsion_info.get_building_block().get_atomic_positions(
-                    bb_torsion.get_atom_ids()[2]
-                )
-            )[0],
-            pt4=tuple(
-                torsion_info.get_building_block().get_atomic_positions(
-                    bb_torsion.get_atom_ids()[3]
-                )
-            )[0],
+            *torsion_info.get_building_block().get_atomic_positions(
+                bb_torsion.get_atom_ids()
+            )
         )
     return angle, bb_angle
 
@@ -0,0 +1,180 @@
+from collections import defaultdict
+import numpy as np
+import networkx as nx
+import pytest
+import stko
+import stk
+
+
+def _component_ids(components):
+    return [
+        sorted(node.get_id() for node in component)
+        for component in components
+    ]
+
+
+def _a_cage():
+    return stk.ConstructedMolecule(
+        stk.cage.FourPlusSix(
+            building_blocks=(
+                stk.BuildingBlock('NCCN', [stk.PrimaryAminoFactory()]),
+                stk.BuildingBlock(
+                    smiles='O=CC(C=O)C=O',
+                    functional_groups=[stk.AldehydeFactory()],
+                ),
+            ),
+        ),
+    )
+
+
+def test_init_from_molecule():
+    for molecule in (
+        stk.BuildingBlock('NCCN'),
+        stk.BuildingBlock('CCO.CC'),
+        _a_cage(),
+    ):
+        network = stko.Network.init_from_molecule(molecule)
+        graph = network.get_graph()
+
+        nodes = list(network.get_nodes())
+        assert [node.get_id() for node in nodes] == [
+            atom.get_id() for atom in molecule.get_atoms()
+        ]
+        assert np.allclose(
+            [node.get_position() for node in nodes],
+            molecule.get_position_matrix(),
+        )
+
+        edges = {
+            frozenset((u.get_id(), v.get_id())): data
+            for u, v, data in graph.edges(data=True)
+        }
+        assert len(edges) == molecule.get_num_bonds()
+        for bond in molecule.get_bonds():
+            data = edges[frozenset((
+                bond.get_atom1().get_id(),
+                bond.get_atom2().get_id(),
+            ))]
+            assert data['order'] == bond.get_order()
+            assert data['periodicity'] == bond.get_periodicity()
+
+
+def test_init_from_graph():
+    atom1 = stko.PositionedAtom(stk.C(0), (0., 0., 0.))
+    atom2 = stko.PositionedAtom(stk.C(1), (1.5, 0., 0.))
+    graph = nx.Graph()
+    graph.add_edge(atom1, atom2)
+
+    network = stko.Network(graph)
+    # The caller's graph is not shared with the network.
+    graph.remove_edge(atom1, atom2)
+
+    (*_, data), = network.get_graph().edges(data=True)
+    assert data == {'order': 1, 'periodicity': (0, 0, 0)}
+    assert _component_ids(network.get_connected_components()) == [
+        [0, 1],
+    ]
+
+
+def test_with_deleted_bonds():
+    network = stko.Network.init_from_molecule(
+        stk.BuildingBlock('NCCN')
+    )
+    deleted = network.with_deleted_bonds([(2, 1)])
+
+    assert _component_ids(deleted.get_connected_components()) == [
+        [0, 1, 4, 5, 6, 7],
+        [2, 3, 8, 9, 10, 11],
+    ]
+    assert deleted.get_graph().number_of_edges() == 10
+
+    # The original network is not changed by the deletion.
+    assert network.get_graph().number_of_edges() == 11
+    assert _component_ids(network.get_connected_components()) == [
+        list(range(12)),
+    ]
+
+
+def test_with_deleted_bonds_cage():
+    cage = _a_cage()
+    long_bond_ids = stko.get_long_bond_ids(cage)
+    network = stko.Network.init_from_molecule(cage)
+    components = _component_ids(
+        network.with_deleted_bonds(long_bond_ids)
+        .get_connected_components()
+    )
+
+    building_blocks = defaultdict(list)
+    for atom_info in cage.get_atom_infos():
+        building_blocks[atom_info.get_building_block_id()].append(
+            atom_info.get_atom().get_id()
+        )
+    assert components == sorted(
+        sorted(atom_ids) for atom_ids in building_blocks.values()
+    )
+
+
+def test_empty_molecule():
+    network = stko.Network.init_from_molecule(
+        stk.BuildingBlock.init(
+            atoms=(),
+            bonds=(),
+            position_matrix=np.zeros((0, 3)),
+        )
+    )
+    assert network.get_connected_components() == []
+    assert network.get_connected_components(copy=True) == []
+    assert len(network.get_fragment_labels()) == 0
+    assert network.get_graph().number_of_nodes() == 0
+
+
+def test_connected_components_copy():
+    network = stko.Network.init_from_molecule(
+        stk.BuildingBlock('CCO.CC')
+    )
+
+    for component in network.get_connected_components():
+        assert nx.is_frozen(component)
+        node = next(iter(component))
+        with pytest.raises(nx.NetworkXError):
+            component.remove_node(node)
+
+    for component in network.get_connected_components(copy=True):
+        assert not nx.is_frozen(component)
+        component.remove_nodes_from(list(component))
+        assert component.number_of_nodes() == 0
+
+    # Changing the copies does not change the network.
+    assert network.get_graph().number_of_nodes() == 17
+    assert _component_ids(network.get_connected_components()) == [
+        [0, 1, 2, 5, 6, 7, 8, 9, 10],
+        [3, 4, 11, 12, 13, 14, 15, 16],
+    ]
+
+
+def test_get_fragment_labels():
+    molecule = stk.BuildingBlock('CCO.CC')
+    network = stko.Network.init_from_molecule(molecule)
+    labels = network.get_fragment_labels()
+
+    # Labels follow the order of the first atom of each component,
+    # and agree with get_connected_components.
+    assert labels.tolist() == [0]*3 + [1]*2 + [0]*6 + [1]*6
+    for label, component in enumerate(
+        network.get_connected_components()
+    ):
+        for node in component:
+            assert labels[node.get_id()] == label
+
+    # The labels are read-only and shared with clones.
+    assert not labels.flags.writeable
+    with pytest.raises(ValueError):
+        labels[0] = 1
+    assert network.clone().get_fragment_labels() is labels
+
+    # Deleting a bond gives new labels, without changing the old ones.
+    deleted = network.with_deleted_bonds([(1, 2)])
+    assert deleted.get_fragment_labels().tolist() == (
+        [0, 0, 1, 2, 2] + [0]*5 + [1] + [2]*6
+    )
+    assert network.get_fragment_labels().tolist() == labels.tolist()
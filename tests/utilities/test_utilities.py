@@ -0,0 +1,105 @@
+import math
+import numpy as np
+from pytest import approx
+import stko
+
+
+def _a_position_matrix():
+    return np.array([
+        [0., 0., 0.],
+        [1., 0., 0.],
+        [1., 1., 0.],
+        [1., 1., 1.],
+        [2., -1., 3.],
+    ])
+
+
+def test_get_atom_distances():
+    position_matrix = _a_position_matrix()
+    atom_pairs = [(0, 1), (0, 3), (4, 2), (2, 2)]
+    expected = [
+        stko.get_atom_distance(position_matrix, id1, id2)
+        for id1, id2 in atom_pairs
+    ]
+
+    distances = stko.get_atom_distances(position_matrix, atom_pairs)
+    assert distances.tolist() == approx(expected)
+    assert distances.tolist() == approx([1., 3**0.5, 14**0.5, 0.])
+
+    # Generators and arrays of pairs give the same result.
+    assert stko.get_atom_distances(
+        position_matrix=position_matrix,
+        atom_pairs=(pair for pair in atom_pairs),
+    ).tolist() == approx(expected)
+    assert stko.get_atom_distances(
+        position_matrix=position_matrix,
+        atom_pairs=np.array(atom_pairs),
+    ).tolist() == approx(expected)
+
+
+def test_get_atom_distances_empty():
+    position_matrix = _a_position_matrix()
+    for atom_pairs in ([], (), np.zeros((0, 2), dtype=int)):
+        distances = stko.get_atom_distances(
+            position_matrix=position_matrix,
+            atom_pairs=atom_pairs,
+        )
+        assert distances.shape == (0, )
+
+
+def test_calculate_dihedral():
+    position_matrix = _a_position_matrix()
+    assert stko.calculate_dihedral(
+        *position_matrix[[0, 1, 2, 3]]
+    ) == approx(90.)
+    assert stko.calculate_dihedral(
+        *position_matrix[[3, 2, 1, 0]]
+    ) == approx(90.)
+
+    # Coincident central points give nan in both the single and the
+    # vectorised version.
+    points = position_matrix[[0, 1, 1, 2]]
+    assert math.isnan(stko.calculate_dihedral(*points))
+    assert math.isnan(
+        stko.calculate_dihedrals(points, [(0, 1, 2, 3)])[0]
+    )
+
+
+def test_vector_angle():
+    assert stko.vector_angle(
+        np.array([1., 0., 0.]),
+        np.array([0., 2., 0.]),
+    ) == approx(math.pi/2)
+    assert stko.vector_angle(
+        np.array([1., 1., 0.]),
+        np.array([2., 2., 0.]),
+    ) == 0.
+    assert stko.vector_angle(
+        np.array([1., 1., 0.]),
+        np.array([-1., -1., 0.]),
+    ) == approx(math.pi)
+
+    # A zero length vector gives an angle of 0.
+    assert stko.vector_angle(np.zeros(3), np.array([1., 0., 0.])) == 0.
+    assert stko.vector_angle(np.zeros(3), np.zeros(3)) == 0.
+
+
+def test_calculate_dihedrals():
+    position_matrix = np.random.default_rng(4).normal(size=(8, 3))
+    atom_ids = [
+        (0, 1, 2, 3),
+        (3, 2, 1, 0),
+        (4, 5, 6, 7),
+        (7, 0, 3, 5),
+        (1, 6, 2, 4),
+    ]
+    dihedrals = stko.calculate_dihedrals(position_matrix, atom_ids)
+    assert dihedrals.tolist() == approx([
+        stko.calculate_dihedral(*position_matrix[list(ids)])
+        for ids in atom_ids
+    ])
+
+
+def test_calculate_dihedrals_empty():
+    dihedrals = stko.calculate_dihedrals(_a_position_matrix(), [])
+    assert dihedrals.shape == (0, )